@@ -12,11 +12,13 @@ import os
 import subprocess
 import sys
 import signal
-import platform
+import shutil
 import threading
 import time
+from collections import deque
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
 from rich.console import Console
 from rich.table import Table
 
@@ -26,6 +28,7 @@ interrupted = False
 current_process = None
 current_output_file = None
 current_temp_file = None  # Track temporary remuxed file for cleanup
+ffmpeg_priority_kwargs: Dict = {}  # Extra Popen kwargs for ffmpeg (Windows priority class)
 
 
 def signal_handler(signum, frame):
@@ -76,15 +79,28 @@ class CompressStats:
         self.errors: List[Tuple[str, str]] = []
 
 
+class CompressResult:
+    """Outcome of compressing a single file in a batch worker"""
+    def __init__(self, name: str):
+        self.name = name
+        self.status = "failed"  # succeeded, skipped, failed or interrupted
+        self.message = ""
+        self.deleted = False
+        self.delete_error = ""
+
+
 class CompressLogger:
     """Handle logging with rich formatting"""
     def __init__(self):
         self.console = Console()
+        # Recent errors, kept so a quiet batch worker can report why a file failed
+        self.recent_errors = deque(maxlen=10)
     
     def print(self, message: str, style: str = ""):
         self.console.print(message, style=style)
     
     def error(self, message: str):
+        self.recent_errors.append(message)
         self.console.print(f"[ERROR] {message}", style="bold red")
     
     def warning(self, message: str):
@@ -103,26 +119,92 @@ class CompressLogger:
 logger = CompressLogger()
 
 
+# ffmpeg/ffprobe are resolved on PATH once at import rather than on every exec
+FFMPEG = shutil.which("ffmpeg") or "ffmpeg"
+FFPROBE = shutil.which("ffprobe") or "ffprobe"
+
+# Static ffmpeg argument groups, built once at import time. Only the paths
+# and quality settings are substituted per file.
+REMUX_ARGS = (
+    "-c", "copy",  # Copy all streams without re-encoding
+    "-movflags", "+faststart",
+    "-y",  # Overwrite if exists
+)
+
+MAP_V_ARGS = ("-map", "0:v:0")  # Map first video stream
+MAP_AV_ARGS = MAP_V_ARGS + ("-map", "0:a:0")  # Map first video and audio stream
+
+VIDEOTOOLBOX_ARGS = (
+    "-c:v", "hevc_videotoolbox",  # Hardware H.265 encoder
+    "-b:v", "6M",  # Target bitrate (adjust based on resolution)
+    "-q:v", "65",  # Quality (0-100, higher = better, 65 ≈ CRF 24)
+)
+
+X265_PARAMS_ARGS = (
+    "-x265-params", "log-level=error:aq-mode=3:aq-strength=0.8:deblock=-1,-1",
+    # aq-mode=3: Better adaptive quantization for streaming content
+    # aq-strength=0.8: Moderate strength to reduce blockiness
+    # deblock=-1,-1: Slight deblocking to reduce Twitch compression artifacts
+)
+
+NVENC_INPUT_ARGS = (
+    "-hwaccel", "cuda",  # Decode on the GPU
+    "-hwaccel_output_format", "cuda",  # Keep decoded frames in GPU memory for NVENC
+)
+
+# Hardware HEVC encoders in order of preference; libx265 is the software fallback
+HW_ENCODER_PREFERENCE = ("hevc_videotoolbox", "hevc_nvenc", "hevc_qsv", "hevc_vaapi")
+DEFAULT_VAAPI_DEVICE = "/dev/dri/renderD128"
+
+# HEVC sources at or below this bitrate (bits/s) are stream-copied instead of re-encoded
+HEVC_COPY_MAX_BITRATE = 8_000_000
+
+COMPRESS_OUTPUT_ARGS = (
+    "-c:a", "copy",  # Copy audio without re-encoding
+    "-movflags", "+faststart",  # Enable fast start for web playback
+    "-tag:v", "hvc1",  # Apple-compatible HEVC tag
+    "-y",  # Overwrite output file if it exists
+)
+
+
+@lru_cache(maxsize=1)
+def ansi_supported() -> bool:
+    """Whether stdout understands ANSI escapes (turns on VT mode for Windows consoles, once)"""
+    if os.name != "nt":
+        return True
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+    except (AttributeError, OSError):
+        return False
+
+
 def clear_screen():
     """Clear the terminal screen across different platforms"""
-    system = platform.system().lower()
-    if system == 'windows':
-        os.system('cls')
+    if ansi_supported():
+        # Same sequence `clear` emits (home, erase screen, erase scrollback), without a subprocess
+        sys.stdout.write("\x1b[H\x1b[2J\x1b[3J")
+        sys.stdout.flush()
     else:
-        os.system('clear')
+        os.system('cls')
 
 
 def check_ffmpeg_installed() -> bool:
     """Verify that ffmpeg and ffprobe are installed and accessible"""
     try:
         subprocess.run(
-            ["ffmpeg", "-version"],
+            [FFMPEG, "-version"],
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             check=True
         )
         subprocess.run(
-            ["ffprobe", "-version"],
+            [FFPROBE, "-version"],
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             check=True
@@ -132,6 +214,122 @@ def check_ffmpeg_installed() -> bool:
         return False
 
 
+def encoder_args(
+    encoder: str,
+    crf: int,
+    preset: str,
+    hw_accel_device: str = DEFAULT_VAAPI_DEVICE,
+    nvenc_cq: Optional[int] = None,
+    threads: Optional[int] = None,
+    height: Optional[int] = None,
+    source_codec: Optional[str] = None
+) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Build the ffmpeg arguments for an HEVC encoder
+    
+    Args:
+        encoder: libx265 or one of HW_ENCODER_PREFERENCE
+        crf: Quality setting (used as CQ/QP for hardware encoders)
+        preset: x265 encoding preset
+        hw_accel_device: VAAPI render node
+        nvenc_cq: Constant quality for NVENC (defaults to crf)
+        threads: Cap on libx265 worker threads (None = use all cores)
+        height: Scale the output to this height, keeping the aspect ratio (None = source size)
+        source_codec: Input video codec name, used to pick an NVDEC (cuvid) decoder for NVENC
+    
+    Returns:
+        Tuple of (arguments placed before -i, video encoding arguments)
+    """
+    scale_args = ("-vf", f"scale=-2:{height}") if height else ()
+    if encoder == "hevc_videotoolbox":
+        return (), scale_args + VIDEOTOOLBOX_ARGS
+    if encoder == "hevc_nvenc":
+        cq = crf if nvenc_cq is None else nvenc_cq
+        # Scale on the GPU so decoded frames never leave video memory
+        scale_args = ("-vf", f"scale_cuda=-2:{height}") if height else ()
+        decoder = cuvid_decoder(source_codec) if source_codec else None
+        input_args = NVENC_INPUT_ARGS + ("-c:v", decoder) if decoder else NVENC_INPUT_ARGS
+        return input_args, scale_args + ("-c:v", "hevc_nvenc", "-preset", "p4", "-rc", "vbr", "-cq", str(cq), "-b:v", "0")
+    if encoder == "hevc_qsv":
+        return (), scale_args + ("-c:v", "hevc_qsv", "-global_quality", str(crf))
+    if encoder == "hevc_vaapi":
+        vaapi_filter = f"format=nv12,hwupload,scale_vaapi=w=-2:h={height}" if height else "format=nv12,hwupload"
+        return ("-vaapi_device", hw_accel_device), ("-vf", vaapi_filter, "-c:v", "hevc_vaapi", "-qp", str(crf))
+    x265_args = X265_PARAMS_ARGS
+    if threads:
+        # Limit the thread pool so several encodes can share the CPU
+        x265_args = (x265_args[0], f"{x265_args[1]}:pools={threads}")
+    return (), scale_args + ("-c:v", "libx265", "-crf", str(crf), "-preset", preset, *x265_args)
+
+
+@lru_cache(maxsize=None)
+def detect_hw_encoder(hw_accel_device: str = DEFAULT_VAAPI_DEVICE) -> Optional[str]:
+    """
+    Find a usable hardware HEVC encoder (probed once per process)
+    
+    ffmpeg builds list encoders such as hevc_nvenc even without the matching
+    hardware, so each listed candidate is confirmed with a one-frame test encode.
+    
+    Args:
+        hw_accel_device: VAAPI render node to test hevc_vaapi against
+    
+    Returns:
+        Encoder name, or None if only software encoding is available
+    """
+    try:
+        listed = subprocess.run(
+            [FFMPEG, "-hide_banner", "-encoders"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            timeout=5
+        ).stdout
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return None
+    
+    for encoder in HW_ENCODER_PREFERENCE:
+        if encoder.encode() not in listed:
+            continue
+        probe_input_args = ("-vaapi_device", hw_accel_device) if encoder == "hevc_vaapi" else ()
+        _, video_args = encoder_args(encoder, 24, "faster", hw_accel_device)
+        try:
+            result = subprocess.run(
+                [
+                    FFMPEG, "-hide_banner", "-v", "error", *probe_input_args,
+                    "-f", "lavfi", "-i", "color=black:s=256x256:d=0.1",
+                    "-frames:v", "1", *video_args, "-f", "null", "-"
+                ],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                timeout=15
+            )
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            continue
+        if result.returncode == 0:
+            return encoder
+    
+    return None
+
+
+@lru_cache(maxsize=None)
+def cuvid_decoder(codec_name: str) -> Optional[str]:
+    """
+    Return the NVDEC decoder for a source codec (e.g. h264 -> h264_cuvid) if ffmpeg has it
+    
+    Decoding with cuvid keeps frames in GPU memory all the way to hevc_nvenc.
+    """
+    decoder = f"{codec_name}_cuvid"
+    try:
+        listed = subprocess.run(
+            [FFMPEG, "-hide_banner", "-decoders"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            timeout=5
+        ).stdout
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return None
+    return decoder if f" {decoder} ".encode() in listed else None
+
+
 def find_ts_files(directory: Path, recursive: bool = False) -> List[Path]:
     """
     Find all .ts files in the given directory, excluding macOS metadata files
@@ -152,6 +350,11 @@ def find_ts_files(directory: Path, recursive: bool = False) -> List[Path]:
     return sorted(ts_files)
 
 
+def part_path(output_path: Path) -> Path:
+    """Path ffmpeg writes to until the output is complete (out.mp4 -> out.mp4.part)"""
+    return output_path.with_name(output_path.name + ".part")
+
+
 def get_output_path(input_path: Path) -> Path:
     """Generate output .mp4 path from input .ts path"""
     return input_path.with_suffix('.mp4')
@@ -173,7 +376,7 @@ def mp4_exists_and_valid(mp4_path: Path) -> bool:
     try:
         result = subprocess.run(
             [
-                "ffprobe",
+                FFPROBE,
                 "-v", "error",
                 "-show_format",
                 "-print_format", "json",
@@ -215,7 +418,7 @@ def probe_file(file_path: Path) -> Optional[Dict]:
     try:
         result = subprocess.run(
             [
-                "ffprobe",
+                FFPROBE,
                 "-v", "error",
                 "-show_format",
                 "-show_streams",
@@ -241,7 +444,7 @@ def probe_file(file_path: Path) -> Optional[Dict]:
         return None
 
 
-def remux_ts_to_mp4(input_path: Path, output_path: Path) -> bool:
+def remux_ts_to_mp4(input_path: Path, output_path: Path, show_progress: bool = True) -> bool:
     """
     Remux .ts file to .mp4 without re-encoding (fast, lossless container change)
     
@@ -253,6 +456,7 @@ def remux_ts_to_mp4(input_path: Path, output_path: Path) -> bool:
     Args:
         input_path: Source .ts file
         output_path: Temporary .mp4 file (will be used for compression)
+        show_progress: Echo ffmpeg's time= progress lines to the terminal
     
     Returns:
         True if remux succeeded, False otherwise
@@ -265,14 +469,7 @@ def remux_ts_to_mp4(input_path: Path, output_path: Path) -> bool:
     logger.info(f"Remuxing {input_path.name} to temporary MP4 (fast, no re-encoding)...")
     
     # Remux command - just copy streams without re-encoding
-    cmd = [
-        "ffmpeg",
-        "-i", str(input_path),
-        "-c", "copy",  # Copy all streams without re-encoding
-        "-movflags", "+faststart",
-        "-y",  # Overwrite if exists
-        str(output_path)
-    ]
+    cmd = [FFMPEG, "-i", str(input_path), *REMUX_ARGS, str(output_path)]
     
     try:
         current_temp_file = output_path
@@ -280,7 +477,8 @@ def remux_ts_to_mp4(input_path: Path, output_path: Path) -> bool:
             cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            universal_newlines=True
+            universal_newlines=True,
+            **ffmpeg_priority_kwargs
         )
         
         stderr_lines = []
@@ -290,7 +488,7 @@ def remux_ts_to_mp4(input_path: Path, output_path: Path) -> bool:
                 current_process.terminate()
                 break
             stderr_lines.append(line)
-            if "time=" in line.lower():
+            if show_progress and "time=" in line.lower():
                 current_time = time.time()
                 if current_time - last_update_time >= 1.0:
                     print(f"\r  Remux: {line.strip()}", end='', flush=True)
@@ -298,7 +496,8 @@ def remux_ts_to_mp4(input_path: Path, output_path: Path) -> bool:
         
         current_process.wait()
         
-        print()
+        if show_progress:
+            print()
         
         if interrupted:
             if output_path.exists():
@@ -337,13 +536,26 @@ def remux_ts_to_mp4(input_path: Path, output_path: Path) -> bool:
         return False
 
 
-def compress_file(input_path: Path, output_path: Path, allow_video_only: bool = False, crf: int = 24, preset: str = "faster") -> bool:
+def compress_file(
+    input_path: Path,
+    output_path: Path,
+    allow_video_only: bool = False,
+    crf: int = 24,
+    preset: str = "faster",
+    show_progress: bool = True,
+    encoder: Optional[str] = None,
+    hw_accel_device: str = DEFAULT_VAAPI_DEVICE,
+    nvenc_cq: Optional[int] = None,
+    threads: Optional[int] = None,
+    renditions: Sequence[Tuple[Path, int, Optional[int]]] = ()
+) -> bool:
     """
     Compress .ts file to .mp4 using ffmpeg with H.265/HEVC
     
     Process:
     1. Remux .ts to temporary .mp4 (normalizes container, handles discontinuities)
-    2. Compress remuxed .mp4 to final H.265 output
+    2. Compress remuxed .mp4 to final H.265 output (plus any extra renditions,
+       all encoded from a single decode of the input)
     3. Clean up temporary remuxed file
     
     Args:
@@ -352,6 +564,12 @@ def compress_file(input_path: Path, output_path: Path, allow_video_only: bool =
         allow_video_only: Allow files with only video stream
         crf: Constant Rate Factor for quality (0-51, lower = better quality, 24 recommended for streaming content)
         preset: Encoding preset (ultrafast, superfast, veryfast, faster, fast, medium, slow, slower, veryslow)
+        show_progress: Echo ffmpeg's time= progress lines to the terminal
+        encoder: HEVC encoder to use (None = best detected hardware encoder, else libx265)
+        hw_accel_device: VAAPI render node for hevc_vaapi
+        nvenc_cq: Constant quality for hevc_nvenc (defaults to crf)
+        threads: Cap on libx265 worker threads (None = use all cores)
+        renditions: Extra (output_path, crf, height) outputs, e.g. a smaller preview copy
     
     Returns:
         True if compression succeeded, False otherwise
@@ -364,8 +582,12 @@ def compress_file(input_path: Path, output_path: Path, allow_video_only: bool =
     # Step 1: Remux .ts to temporary .mp4 first
     # This normalizes the container and handles Twitch stream discontinuities
     temp_remux_path = output_path.with_suffix('.tmp.mp4')
+    # ffmpeg writes to .part files that are renamed into place only on success,
+    # so an interrupted run never leaves a half-written .mp4 behind
+    final_paths = [output_path, *(r[0] for r in renditions)]
+    part_paths = [part_path(path) for path in final_paths]
     
-    if not remux_ts_to_mp4(input_path, temp_remux_path):
+    if not remux_ts_to_mp4(input_path, temp_remux_path, show_progress):
         logger.error(f"Failed to remux {input_path.name}")
         # Cleanup already handled by remux_ts_to_mp4
         return False
@@ -393,66 +615,47 @@ def compress_file(input_path: Path, output_path: Path, allow_video_only: bool =
         current_temp_file = None
         return False
     
-    # Step 3: Detect hardware acceleration availability (macOS)
-    use_hardware = False
-    if platform.system() == 'Darwin':  # macOS
-        try:
-            probe_result = subprocess.run(
-                ["ffmpeg", "-hide_banner", "-encoders"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                timeout=5
-            )
-            if b"hevc_videotoolbox" in probe_result.stdout:
-                use_hardware = True
-                logger.info("Hardware acceleration (VideoToolbox) detected and will be used")
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
+    map_args = MAP_AV_ARGS if audio_streams else MAP_V_ARGS
+    source = video_streams[0]
+    source_bitrate = int(source.get('bit_rate') or probe_data.get('format', {}).get('bit_rate') or 0)
     
-    # Step 4: Build ffmpeg command for H.265 compression
-    # Compress from the remuxed MP4, not the original .ts
-    logger.info(f"Compressing remuxed file to H.265...")
-    cmd = [
-        "ffmpeg",
-        "-i", str(temp_remux_path),  # Use remuxed file as input
-        "-map", "0:v:0",  # Map first video stream
-    ]
-    
-    if audio_streams:
-        cmd.extend(["-map", "0:a:0"])  # Map first audio stream
-    
-    if use_hardware:
-        cmd.extend([
-            "-c:v", "hevc_videotoolbox",  # Hardware H.265 encoder
-            "-b:v", "6M",  # Target bitrate (adjust based on resolution)
-            "-q:v", "65",  # Quality (0-100, higher = better, 65 ≈ CRF 24)
-        ])
+    if source.get('codec_name') == 'hevc' and 0 < source_bitrate <= HEVC_COPY_MAX_BITRATE and not renditions:
+        # Already H.265 at a sensible bitrate: re-encoding would only lose quality
+        logger.info(f"Source is already H.265 ({source_bitrate / 1_000_000:.1f} Mbps), copying video without re-encoding...")
+        cmd = [FFMPEG, "-i", str(temp_remux_path), *map_args, "-c:v", "copy", *COMPRESS_OUTPUT_ARGS, "-f", "mp4", str(part_paths[0])]
     else:
-        cmd.extend([
-            "-c:v", "libx265",  # Use H.265/HEVC codec
-            "-crf", str(crf),  # Quality setting
-            "-preset", preset,  # Encoding speed preset
-            "-x265-params", "log-level=error:aq-mode=3:aq-strength=0.8:deblock=-1,-1",
-            # aq-mode=3: Better adaptive quantization for streaming content
-            # aq-strength=0.8: Moderate strength to reduce blockiness
-            # deblock=-1,-1: Slight deblocking to reduce Twitch compression artifacts
-        ])
-    
-    cmd.extend([
-        "-c:a", "copy",  # Copy audio without re-encoding
-        "-movflags", "+faststart",  # Enable fast start for web playback
-        "-tag:v", "hvc1",  # Apple-compatible HEVC tag
-        "-y",  # Overwrite output file if it exists
-        str(output_path)
-    ])
+        # Step 3: Pick the encoder (hardware detection is cached after the first file)
+        if encoder is None:
+            encoder = detect_hw_encoder(hw_accel_device) or "libx265"
+        if encoder != "libx265":
+            logger.info(f"Hardware acceleration ({encoder}) will be used")
+        
+        # Step 4: Build ffmpeg command for H.265 compression
+        # Compress from the remuxed MP4, not the original .ts
+        logger.info(f"Compressing remuxed file to H.265...")
+        input_args, video_args = encoder_args(
+            encoder, crf, preset, hw_accel_device, nvenc_cq, threads, source_codec=source.get('codec_name')
+        )
+        cmd = [FFMPEG, *input_args, "-i", str(temp_remux_path), *map_args]
+        cmd += video_args
+        cmd += COMPRESS_OUTPUT_ARGS
+        cmd += ["-f", "mp4", str(part_paths[0])]
+        # Each rendition is another output clause fed from the same decoded frames
+        for rendition_part, (_, rendition_crf, rendition_height) in zip(part_paths[1:], renditions):
+            rendition_cq = None if nvenc_cq is None else nvenc_cq + (rendition_crf - crf)
+            cmd += map_args
+            cmd += encoder_args(encoder, rendition_crf, preset, hw_accel_device, rendition_cq, threads, rendition_height)[1]
+            cmd += COMPRESS_OUTPUT_ARGS
+            cmd += ["-f", "mp4", str(rendition_part)]
     
     try:
-        current_output_file = output_path
+        current_output_file = part_paths[0]
         current_process = subprocess.Popen(
             cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            universal_newlines=True
+            universal_newlines=True,
+            **ffmpeg_priority_kwargs
         )
         
         stderr_lines = []
@@ -462,7 +665,7 @@ def compress_file(input_path: Path, output_path: Path, allow_video_only: bool =
                 current_process.terminate()
                 break
             stderr_lines.append(line)
-            if "time=" in line.lower():
+            if show_progress and "time=" in line.lower():
                 current_time = time.time()
                 if current_time - last_update_time >= 1.0:
                     print(f"\r  {line.strip()}", end='', flush=True)
@@ -470,15 +673,14 @@ def compress_file(input_path: Path, output_path: Path, allow_video_only: bool =
         
         current_process.wait()
         
-        print()
+        if show_progress:
+            print()
         
         if interrupted:
-            if output_path.exists():
-                output_path.unlink()
-                logger.info(f"Deleted partial compressed file: {output_path.name}")
-            if temp_remux_path.exists():
-                temp_remux_path.unlink()
-                logger.info(f"Deleted temporary remux file: {temp_remux_path.name}")
+            for path in part_paths:
+                path.unlink(missing_ok=True)
+            temp_remux_path.unlink(missing_ok=True)
+            logger.info(f"Deleted partial output and temporary remux files for {input_path.name}")
             current_temp_file = None
             return False
         
@@ -486,20 +688,19 @@ def compress_file(input_path: Path, output_path: Path, allow_video_only: bool =
             error_msg = ''.join(stderr_lines)
             logger.error(f"ffmpeg compression failed for {input_path.name}:")
             logger.error(error_msg)
-            if output_path.exists():
-                output_path.unlink()
-                logger.info(f"Deleted partial compressed file: {output_path.name}")
-            if temp_remux_path.exists():
-                temp_remux_path.unlink()
-                logger.info(f"Deleted temporary remux file: {temp_remux_path.name}")
+            for path in part_paths:
+                path.unlink(missing_ok=True)
+            temp_remux_path.unlink(missing_ok=True)
+            logger.info(f"Deleted partial output and temporary remux files for {input_path.name}")
             current_temp_file = None
             return False
         
-        # Compression succeeded! Clean up temp remux file
+        # Compression succeeded! Move outputs into place and clean up temp remux file
+        for final, part in zip(final_paths, part_paths):
+            os.replace(part, final)
         logger.success(f"Compression complete")
-        if temp_remux_path.exists():
-            temp_remux_path.unlink()
-            logger.info(f"Deleted temporary remux file: {temp_remux_path.name}")
+        temp_remux_path.unlink(missing_ok=True)
+        logger.info(f"Deleted temporary remux file: {temp_remux_path.name}")
         
         current_process = None
         current_output_file = None
@@ -514,27 +715,28 @@ def compress_file(input_path: Path, output_path: Path, allow_video_only: bool =
                 current_process.wait(timeout=5)
             except:
                 current_process.kill()
-        if output_path.exists():
-            output_path.unlink()
-            logger.info(f"Deleted partial compressed file: {output_path.name}")
-        if temp_remux_path.exists():
-            temp_remux_path.unlink()
-            logger.info(f"Deleted temporary remux file: {temp_remux_path.name}")
+        for path in part_paths:
+            path.unlink(missing_ok=True)
+        temp_remux_path.unlink(missing_ok=True)
+        logger.info(f"Deleted partial output and temporary remux files for {input_path.name}")
         current_temp_file = None
         raise
     except Exception as e:
         logger.error(f"Unexpected error during compression of {input_path.name}: {e}")
-        if output_path.exists():
-            output_path.unlink()
-            logger.info(f"Deleted partial compressed file: {output_path.name}")
-        if temp_remux_path.exists():
-            temp_remux_path.unlink()
-            logger.info(f"Deleted temporary remux file: {temp_remux_path.name}")
+        for path in part_paths:
+            path.unlink(missing_ok=True)
+        temp_remux_path.unlink(missing_ok=True)
+        logger.info(f"Deleted partial output and temporary remux files for {input_path.name}")
         current_temp_file = None
         return False
 
 
-def verify_compression(input_path: Path, output_path: Path, tolerance: float = 2.0) -> Tuple[bool, str]:
+def verify_compression(
+    input_path: Path,
+    output_path: Path,
+    tolerance: float = 2.0,
+    expected_codecs: Tuple[str, ...] = ("hevc", "h265")
+) -> Tuple[bool, str]:
     """
     Verify that compression was successful by comparing input and output
     
@@ -546,6 +748,7 @@ def verify_compression(input_path: Path, output_path: Path, tolerance: float = 2
         input_path: Original .ts file
         output_path: Compressed .mp4 file
         tolerance: Duration tolerance percentage (default 2.0 = allow up to 2x duration difference)
+        expected_codecs: Accepted output video codecs (remuxed files keep their source codec)
     
     Returns:
         Tuple of (success: bool, error_message: str)
@@ -582,8 +785,8 @@ def verify_compression(input_path: Path, output_path: Path, tolerance: float = 2
     
     output_vcodec = output_video[0].get('codec_name', '').lower()
     
-    if output_vcodec not in ['hevc', 'h265']:
-        return False, f"Expected HEVC codec, got: {output_vcodec}"
+    if output_vcodec not in expected_codecs:
+        return False, f"Expected {'/'.join(expected_codecs)} codec, got: {output_vcodec}"
     
     if output_audio:
         output_acodec = output_audio[0].get('codec_name', '').lower()
@@ -700,6 +903,164 @@ def verify_compression(input_path: Path, output_path: Path, tolerance: float = 2
     return True, "Verification passed"
 
 
+def probe_duration(file_path: Path) -> Optional[float]:
+    """Return the container duration in seconds, or None if ffprobe can't read it"""
+    try:
+        result = subprocess.run(
+            [
+                FFPROBE,
+                "-v", "error",
+                "-show_entries", "format=duration",
+                "-of", "default=noprint_wrappers=1:nokey=1",
+                str(file_path)
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            timeout=30
+        )
+        return float(result.stdout) if result.returncode == 0 else None
+    except (subprocess.TimeoutExpired, FileNotFoundError, ValueError):
+        return None
+
+
+def quick_verify(input_path: Path, output_path: Path) -> bool:
+    """
+    Cheap sanity check after a successful ffmpeg run
+    
+    Only reads the container durations and file sizes. A False result doesn't
+    mean the output is bad, just that the full verify_compression is needed.
+    """
+    try:
+        input_size = input_path.stat().st_size
+        output_size = output_path.stat().st_size
+    except OSError:
+        return False
+    if output_size <= 0.1 * input_size:
+        return False
+    
+    input_duration = probe_duration(input_path)
+    output_duration = probe_duration(output_path)
+    if not input_duration or not output_duration:
+        return False
+    return abs(input_duration - output_duration) <= 1.0
+
+
+def init_worker(nice: int = 0, reserved_cores: int = 0):
+    """
+    Set up a batch worker process
+    
+    Silences per-file console output, and lowers the worker's priority and
+    optionally its CPU set. The ffmpeg processes it starts inherit both, so
+    compression doesn't starve recordings running at the same time.
+    
+    Args:
+        nice: Niceness increment (POSIX); any value > 0 selects below-normal priority on Windows
+        reserved_cores: Number of CPUs to keep free of ffmpeg (Linux only)
+    """
+    global ffmpeg_priority_kwargs
+    logger.console.quiet = True
+    
+    if nice > 0:
+        if hasattr(os, "nice"):
+            os.nice(nice)
+        else:
+            ffmpeg_priority_kwargs = {"creationflags": subprocess.BELOW_NORMAL_PRIORITY_CLASS}
+    
+    if reserved_cores > 0 and hasattr(os, "sched_setaffinity"):
+        cpus = sorted(os.sched_getaffinity(0))
+        if len(cpus) > reserved_cores:
+            os.sched_setaffinity(0, cpus[:-reserved_cores])
+
+
+def compress_recording(
+    ts_path: Path,
+    mp4_path: Path,
+    crf: int,
+    preset: str,
+    delete_original: bool,
+    encoder: Optional[str] = None,
+    hw_accel_device: str = DEFAULT_VAAPI_DEVICE,
+    nvenc_cq: Optional[int] = None,
+    threads: Optional[int] = None,
+    renditions: Sequence[Tuple[Path, int, Optional[int]]] = (),
+    remux_only: bool = False
+) -> CompressResult:
+    """
+    Compress, verify and optionally delete one .ts file without prompting
+
+    Runs inside a worker process during batch compression, so everything the
+    caller needs is returned in the result rather than printed.
+
+    Args:
+        ts_path: Source .ts file
+        mp4_path: Destination .mp4 file
+        crf: Constant Rate Factor for quality
+        preset: x265 encoding preset
+        delete_original: Delete the .ts after successful compression or if a valid MP4 exists
+        encoder: HEVC encoder to use (None = auto-detect)
+        hw_accel_device: VAAPI render node for hevc_vaapi
+        nvenc_cq: Constant quality for hevc_nvenc (defaults to crf)
+        threads: Cap on libx265 worker threads (None = use all cores)
+        renditions: Extra (output_path, crf, height) outputs encoded in the same pass
+        remux_only: Just copy the streams into an MP4 container (no re-encode, no renditions)
+
+    Returns:
+        CompressResult describing what happened
+    """
+    result = CompressResult(ts_path.name)
+    logger.recent_errors.clear()
+
+    if mp4_exists_and_valid(mp4_path):
+        result.status = "skipped"
+    else:
+        try:
+            if remux_only:
+                outputs, expected_codecs = (mp4_path,), ("h264", "hevc", "h265")
+                temp_path = mp4_path.with_suffix('.tmp.mp4')
+                compressed = remux_ts_to_mp4(ts_path, temp_path, show_progress=False)
+                if compressed:
+                    os.replace(temp_path, mp4_path)
+            else:
+                outputs, expected_codecs = (mp4_path, *(r[0] for r in renditions)), ("hevc", "h265")
+                compressed = compress_file(
+                    ts_path, mp4_path, allow_video_only=False, crf=crf, preset=preset, show_progress=False,
+                    encoder=encoder, hw_accel_device=hw_accel_device, nvenc_cq=nvenc_cq, threads=threads,
+                    renditions=renditions
+                )
+        except KeyboardInterrupt:
+            result.status = "interrupted"
+            return result
+
+        if not compressed:
+            result.status = "interrupted" if interrupted else "failed"
+            # The worker's console is silenced, so pass the logged cause back;
+            # ffmpeg's stderr is cut down to its last few lines
+            details = ["\n".join(message.strip().splitlines()[-5:]) for message in logger.recent_errors if message.strip()]
+            result.message = "\n".join(details) or "Compression failed"
+            return result
+
+        for output_path in outputs:
+            if quick_verify(ts_path, output_path):
+                logger.info(f"Quick verification passed for {output_path.name}")
+                continue
+            logger.info(f"Quick verification inconclusive for {output_path.name}, running full verification")
+            success, message = verify_compression(ts_path, output_path, expected_codecs=expected_codecs)
+            if not success:
+                result.message = f"{output_path.name}: {message}"
+                return result
+
+        result.status = "succeeded"
+
+    if delete_original:
+        try:
+            ts_path.unlink(missing_ok=True)
+            result.deleted = True
+        except OSError as e:  # e.g. permission denied
+            result.delete_error = str(e)
+
+    return result
+
+
 def prompt_delete(file_path: Path, auto_yes: bool = False) -> bool:
     """
     Prompt user to delete original file
@@ -760,10 +1121,10 @@ def process_file(
         # since compression was already done previously
         if prompt_delete(ts_path, auto_yes):
             try:
-                ts_path.unlink()
+                ts_path.unlink(missing_ok=True)
                 logger.success(f"Deleted original: {ts_path.name}")
                 stats.deleted += 1
-            except Exception as e:
+            except OSError as e:
                 logger.error(f"Failed to delete {ts_path.name}: {e}")
         else:
             logger.info(f"Kept original: {ts_path.name}")
@@ -806,10 +1167,10 @@ def process_file(
     
     if prompt_delete(ts_path, auto_yes):
         try:
-            ts_path.unlink()
+            ts_path.unlink(missing_ok=True)
             logger.success(f"Deleted original: {ts_path.name}")
             stats.deleted += 1
-        except Exception as e:
+        except OSError as e:
             logger.error(f"Failed to delete {ts_path.name}: {e}")
     else:
         logger.info(f"Kept original: {ts_path.name}")
@@ -879,9 +1240,10 @@ Quality Guide:
     'faster' preset is recommended for good speed/quality balance
 
 Hardware Acceleration:
-  - On macOS with Apple Silicon, VideoToolbox hardware encoding is automatically detected
+  - VideoToolbox (macOS), NVENC, Quick Sync and VAAPI HEVC encoders are detected
+    automatically; each is confirmed with a one-frame test encode
   - Hardware encoding is typically 10-30x faster than software encoding
-  - If detected, CRF setting is converted to equivalent quality (q:v parameter)
+  - If detected, CRF setting is converted to the encoder's quality parameter
 
 Prerequisites:
   - ffmpeg with libx265 support must be installed and available on PATH
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Long-lived streamlink liveness checker
+
+Reads one Twitch channel name per line on stdin and answers each with a JSON
+line on stdout: {"channel": ..., "live": true/false}, or {"channel": ...,
+"error": ...} if streamlink failed. Keeping one process alive means the cost
+of starting Python and loading streamlink's plugins is paid once instead of
+on every check. Checks run concurrently, so answers can arrive out of order.
+
+An optional argument sets streamlink's HTTP timeout in seconds.
+"""
+
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import streamlink
+
+try:
+    from orjson import dumps as json_dumps
+except ImportError:
+    from json import dumps as _dumps
+
+    def json_dumps(obj):
+        return _dumps(obj).encode()
+
+
+def main():
+    session = streamlink.Streamlink()
+    if len(sys.argv) > 1:
+        session.set_option("http-timeout", float(sys.argv[1]))
+    write_lock = threading.Lock()
+
+    def check(channel):
+        try:
+            reply = {"channel": channel, "live": bool(session.streams(f"https://twitch.tv/{channel}"))}
+        except Exception as e:
+            reply = {"channel": channel, "error": str(e)}
+        with write_lock:
+            sys.stdout.buffer.write(json_dumps(reply) + b"\n")
+            sys.stdout.buffer.flush()
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        for line in sys.stdin:
+            channel = line.strip()
+            if channel:
+                executor.submit(check, channel)
+
+
+if __name__ == "__main__":
+    main()
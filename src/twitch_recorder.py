@@ -1,59 +1,231 @@
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import lru_cache
+import atexit
 import time
 import subprocess
 import json
 import os
+import random
+import re
+import select
+import selectors
+import shutil
 import sys
 import signal
-import platform
+import tempfile
 import threading
 import logging
-from logging.handlers import RotatingFileHandler
+import multiprocessing
+from logging.handlers import MemoryHandler, RotatingFileHandler
+from pathlib import Path
+import requests
+from requests.adapters import HTTPAdapter
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, DownloadColumn, TimeRemainingColumn
+from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, DownloadColumn, TransferSpeedColumn, TimeRemainingColumn
 from rich.live import Live
 from rich.table import Table
 
-class StreamRecorder:
-    def __init__(self, config_file='config.json'):
-        self.config_file = config_file
+import src.compression as compress_module
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+HELIX_STREAMS_URL = 'https://api.twitch.tv/helix/streams'
+TWITCH_TOKEN_URL = 'https://id.twitch.tv/oauth2/token'
+HELIX_MAX_LOGINS = 100  # user_login values accepted per /helix/streams request
+TWITCH_GQL_URL = 'https://gql.twitch.tv/gql'
+# Public client id of the twitch.tv web player (the same one streamlink sends)
+TWITCH_WEB_CLIENT_ID = 'kimne78kx3ncx6brgo4mv6wki5h1ko'
+
+# Twitch logins: 3-25 letters, digits or underscores. Anything else never
+# reaches a streamlink URL.
+CHANNEL_NAME_RE = re.compile(r'^[A-Za-z0-9_]{3,25}$')
+
+# Seconds a liveness result is reused before the channel is checked again
+LIVE_CACHE_TTL = 20
+# Longer reuse once the same state has been seen twice in a row; a change
+# drops back to LIVE_CACHE_TTL
+LIVE_CACHE_STABLE_TTL = 60
+
+# A non-empty "streams" object in streamlink --json output means the channel is live
+STREAMS_FOUND_RE = re.compile(rb'"streams":\s*\{\s*"')
+
+# streamlink progress lines look like "[download] Written 12.34 MiB to ... (1m02s @ 2.10 MiB/s)"
+WRITTEN_RE = re.compile(rb'Written (\d+(?:\.\d+)?) ?(bytes|[KMGT]i?B|B)\b')
+SIZE_UNITS = {
+    b'bytes': 1, b'B': 1,
+    b'KiB': 1024, b'KB': 1024,
+    b'MiB': 1024 ** 2, b'MB': 1024 ** 2,
+    b'GiB': 1024 ** 3, b'GB': 1024 ** 3,
+    b'TiB': 1024 ** 4, b'TB': 1024 ** 4,
+}
+
+
+def drain_streamlink_progress(stream, written):
+    """Read streamlink's stderr until EOF, storing the last reported byte count in written[0]"""
+    buffer = b''
+    for chunk in iter(lambda: stream.read1(4096), b''):
+        buffer += chunk
+        # Progress updates are redrawn with \r, log lines end with \n
+        *lines, buffer = re.split(rb'[\r\n]', buffer)
+        for line in lines:
+            match = WRITTEN_RE.search(line)
+            if match:
+                written[0] = int(float(match.group(1)) * SIZE_UNITS[match.group(2)])
+    stream.close()
+
+
+@contextmanager
+def exclusive_file_lock(path):
+    """Hold an advisory exclusive lock on path for the duration of the block (best effort)"""
+    try:
+        lock_file = open(path, 'a')
+    except OSError:
+        yield
+        return
+    with lock_file:
+        if fcntl:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
 
-        # Configure logging early so errors during startup are captured.
-        logs_dir = os.environ.get('LOGS_DIR', '/logs')
+
+def recording_timestamp():
+    """Local time as YYYYMMDD_HHMMSS for recording filenames (no strftime parsing)"""
+    t = time.localtime()
+    return f"{t.tm_year:04d}{t.tm_mon:02d}{t.tm_mday:02d}_{t.tm_hour:02d}{t.tm_min:02d}{t.tm_sec:02d}"
+
+
+def wait_for_process(process, timeout):
+    """process.wait(timeout) that blocks on a pidfd where available instead of polling"""
+    if hasattr(os, 'pidfd_open') and process.returncode is None:
         try:
-            os.makedirs(logs_dir, exist_ok=True)
-        except Exception:
-            logs_dir = os.path.join(os.getcwd(), 'logs')
-            os.makedirs(logs_dir, exist_ok=True)
+            fd = os.pidfd_open(process.pid)
+        except OSError:
+            pass  # Already reaped, or a kernel without pidfd support
+        else:
+            try:
+                ready, _, _ = select.select([fd], [], [], timeout)
+            finally:
+                os.close(fd)
+            if not ready:
+                raise subprocess.TimeoutExpired(process.args, timeout)
+    return process.wait(timeout=timeout)
 
-        log_file = os.path.join(logs_dir, 'log')
-        logger = logging.getLogger('twitch_recorder')
-        logger.setLevel(logging.INFO)
 
-        # Stream handler (stdout)
-        sh = logging.StreamHandler(sys.stdout)
-        sh.setLevel(logging.INFO)
+def kill_process_group(process):
+    """SIGKILL a process started with start_new_session=True together with its children"""
+    if hasattr(os, 'killpg'):
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+            return
+        except ProcessLookupError:
+            return
+        except OSError:
+            pass
+    process.kill()
+
+
+class SignallingMemoryHandler(MemoryHandler):
+    """MemoryHandler that sets an event whenever a record is buffered"""
 
-        # Rotating file handler
-        fh = RotatingFileHandler(log_file, maxBytes=10 * 1024 * 1024, backupCount=5)
-        fh.setLevel(logging.INFO)
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pending = threading.Event()
 
-        formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(message)s')
-        sh.setFormatter(formatter)
-        fh.setFormatter(formatter)
+    def emit(self, record):
+        super().emit(record)
+        self.pending.set()
+
+
+@lru_cache(maxsize=1)
+def get_logger(logs_dir):
+    """Configure the shared 'twitch_recorder' logger once and return it"""
+    try:
+        os.makedirs(logs_dir, exist_ok=True)
+    except Exception:
+        logs_dir = os.path.join(os.getcwd(), 'logs')
+        os.makedirs(logs_dir, exist_ok=True)
+
+    log_file = os.path.join(logs_dir, 'log')
+    logger = logging.getLogger('twitch_recorder')
+    logger.setLevel(logging.INFO)
+    if logger.handlers:
+        return logger
+
+    # Stream handler (stdout)
+    sh = logging.StreamHandler(sys.stdout)
+    sh.setLevel(logging.INFO)
+
+    # Rotating file handler
+    fh = RotatingFileHandler(log_file, maxBytes=10 * 1024 * 1024, backupCount=5)
+    fh.setLevel(logging.INFO)
+
+    formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(message)s')
+    sh.setFormatter(formatter)
+    fh.setFormatter(formatter)
+
+    # Buffer file writes; errors flush straight through, everything else
+    # is written at most once a second by the flusher thread below
+    mh = SignallingMemoryHandler(256, flushLevel=logging.ERROR, target=fh, flushOnClose=True)
+
+    logger.addHandler(sh)
+    logger.addHandler(mh)
+
+    def flush_log_buffer():
+        # Sleeps until something is logged rather than waking every second
+        while True:
+            mh.pending.wait()
+            time.sleep(1)
+            mh.pending.clear()
+            mh.flush()
+
+    flusher = threading.Thread(target=flush_log_buffer, name='log-flusher')
+    flusher.daemon = True
+    flusher.start()
+    atexit.register(mh.flush)
+
+    return logger
+
+
+class StreamRecorder:
+    def __init__(self, config_file='config.json'):
+        self.config_file = config_file
 
-        if not logger.handlers:
-            logger.addHandler(sh)
-            logger.addHandler(fh)
+        # Configure logging early so errors during startup are captured.
+        self.logger = get_logger(os.environ.get('LOGS_DIR', '/logs'))
 
-        self.logger = logger
+        # Config writes are debounced: save_config() marks the config dirty and
+        # a timer (or interpreter exit) writes it once
+        self._config_lock = threading.Lock()
+        self._config_dirty = False
+        self._config_timer = None
+        self._config_written = None  # JSON text of the last successful write
+        atexit.register(self._flush_config)
 
         # Load config after logging is configured
         self.config = self.load_config()
-        self.streamers = self.config.get('streamers', [])
+        # Ordered list (the menus select streamers by position); duplicates dropped
+        self.streamers = list(dict.fromkeys(s for s in self.config.get('streamers', []) if CHANNEL_NAME_RE.match(s)))
+        for invalid in set(self.config.get('streamers', [])) - set(self.streamers):
+            self.logger.warning("Ignoring invalid streamer name in config: %r", invalid)
         self.output_directory = self.config.get('output_directory', 'recordings')
         self.compressed_directory = self.config.get('compressed_directory', os.path.join(self.output_directory, 'compressed'))
         self.default_check_interval = self.config.get('default_check_interval', 2)
+        # While a streamer stays offline the check interval grows 1.5x per check up
+        # to this many minutes; 0 (or anything below the check interval) = fixed interval
+        self.max_check_interval = float(self.config.get('max_check_interval', 0))
         self.default_crf = self.config.get('default_crf', 24)
         self.default_preset = self.config.get('default_preset', 'faster')
 
@@ -61,10 +233,70 @@ class StreamRecorder:
         self.stream_check_timeout = float(self.config.get('stream_check_timeout', 10))
         self.stream_check_retries = int(self.config.get('stream_check_retries', 2))
         self.stream_check_backoff = float(self.config.get('stream_check_backoff', 5))
+        # Most streamlink --json processes allowed to run at once, so monitoring many
+        # streamers without the worker or an API doesn't start them all together
+        self.stream_check_concurrency = max(1, int(self.config.get('stream_check_concurrency', 8)))
+        self._probe_slots = threading.BoundedSemaphore(self.stream_check_concurrency)
         self.run_headless = bool(self.config.get('run_headless', False))
+        self.use_hardware_accel = bool(self.config.get('use_hardware_accel', True))
+        self.hw_accel_device = self.config.get('hw_accel_device', '/dev/dri/renderD128')
+        self.nvenc_cq = self.config.get('nvenc_cq')
+        self.parallel_encodes = int(self.config.get('parallel_encodes', 0))  # 0 = auto
+        # Recordings smaller than this (GB) are only remuxed to MP4, not re-encoded; 0 = always re-encode
+        self.remux_threshold_gb = float(self.config.get('remux_threshold_gb', 0))
+        # Keep compression from starving recordings: ffmpeg niceness and CPUs left free for streamlink
+        self.compression_nice = int(self.config.get('compression_nice', 10))
+        self.compression_reserved_cores = int(self.config.get('compression_reserved_cores', 0))
+        # Extra outputs encoded alongside the main file, e.g. {"suffix": "_720p", "height": 720, "crf": 28}
+        self.renditions = self.config.get('renditions', [])
+        self.verbose = bool(self.config.get('verbose', False))
+
+        # Resolve streamlink once so every check/recording execs it directly
+        self._streamlink_bin = shutil.which('streamlink') or 'streamlink'
+        self._streamlink_progress_flag = None
+        self._streamlink_check_argv = (self._streamlink_bin, '--json')
+
+        # Long-lived streamlink worker (src/streamlink_worker.py) that answers
+        # liveness checks without starting a new streamlink per check. Started
+        # on first use; given up on after repeated crashes.
+        self._sl_worker = None
+        self._sl_worker_lock = threading.Lock()
+        self._sl_worker_crashes = 0
+        self._sl_pending = {}
+        atexit.register(self._stop_streamlink_worker)
+
+        # Optional Twitch Helix credentials; when set, liveness checks for all
+        # channels are batched into a single API request. Either a fixed token
+        # or a client secret (for app access tokens) can be supplied; the
+        # TWITCH_CLIENT_ID/TWITCH_CLIENT_SECRET env vars override the config.
+        self.twitch_client_id = self.config.get('twitch_client_id', '')
+        self.twitch_client_secret = self.config.get('twitch_client_secret', '')
+        self.twitch_oauth_token = self.config.get('twitch_oauth_token', '')
+        self._helix_client_id = os.environ.get('TWITCH_CLIENT_ID') or self.twitch_client_id
+        self._helix_client_secret = os.environ.get('TWITCH_CLIENT_SECRET') or self.twitch_client_secret
+        self._app_token = None
+        self._app_token_expires = 0.0
+        self._app_token_lock = threading.Lock()
+        self._helix_enabled = bool(self._helix_client_id and (self.twitch_oauth_token or self._helix_client_secret))
+        # Without credentials, channels can still be checked in one request
+        # through Twitch's (unofficial) web GraphQL API
+        self.gql_live_check = bool(self.config.get('gql_live_check', False))
+        self._batch_live_checks = self._helix_enabled or self.gql_live_check
+        self._helix_lock = threading.Lock()
+        self._monitored_channels = ()
+        self._http = requests.Session()
+        # One pool per host (api, id and gql.twitch.tv) so switching hosts
+        # doesn't evict the others' kept-alive connections
+        self._http.mount('https://', HTTPAdapter(pool_connections=3, pool_maxsize=4))
+        self._live_cache = {}
+        self._live_cache_lock = threading.Lock()
         self.current_process = None
         self.active_recordings = {}
-        self.recording_threads = {}
+        self._dirs_created = set()
+        self._recording_wakeups = {}
+        self._progress_state = {}
+        self._progress_sizes = {}
+        self._progress_lock = threading.Lock()
         self.monitoring_thread = None
         self.stop_monitoring_event = threading.Event()
         self.stop_all_recordings = threading.Event()
@@ -78,21 +310,19 @@ class StreamRecorder:
             self.monitoring_interrupted = True
             self.console.print("\n[bold yellow]Interrupt received. Stopping all monitoring and recordings...[/bold yellow]")
             self.stop_all_recordings.set()
+            for wakeup in list(self._recording_wakeups.values()):
+                wakeup.set()
 
     def clear_screen(self):
         """Clear the terminal screen across different platforms"""
-        system = platform.system().lower()
-        if system == 'windows':
-            os.system('cls')
-        else:
-            os.system('clear')
+        compress_module.clear_screen()
 
     def load_config(self):
         """Load configuration from JSON file"""
         try:
             if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
+                with open(self.config_file, 'rb') as f:
+                    config = json_loads(f.read())
                     if 'stream_check_timeout' not in config:
                         config['stream_check_timeout'] = 10
                     if 'stream_check_retries' not in config:
@@ -135,21 +365,56 @@ class StreamRecorder:
             }
 
     def save_config(self):
-        """Save configuration to JSON file"""
+        """Schedule the configuration to be written, coalescing rapid successive changes"""
+        with self._config_lock:
+            self._config_dirty = True
+            if self._config_timer:
+                self._config_timer.cancel()
+            self._config_timer = threading.Timer(2.0, self._flush_config)
+            self._config_timer.daemon = True
+            self._config_timer.start()
+
+    def _flush_config(self):
+        """Write the configuration to the JSON file if it has unsaved changes"""
+        with self._config_lock:
+            if not self._config_dirty:
+                return
+            self._config_dirty = False
+            if self._config_timer:
+                self._config_timer.cancel()
+                self._config_timer = None
+
         try:
             self.config = {
                 'streamers': self.streamers,
                 'output_directory': self.output_directory,
                 'compressed_directory': self.compressed_directory,
                 'default_check_interval': self.default_check_interval,
+                'max_check_interval': self.max_check_interval,
                 'default_crf': self.default_crf,
                 'default_preset': self.default_preset,
                 'stream_check_timeout': self.stream_check_timeout,
                 'stream_check_retries': self.stream_check_retries,
-                'stream_check_backoff': self.stream_check_backoff
-                ,
-                'run_headless': self.run_headless
+                'stream_check_backoff': self.stream_check_backoff,
+                'stream_check_concurrency': self.stream_check_concurrency,
+                'run_headless': self.run_headless,
+                'verbose': self.verbose,
+                'use_hardware_accel': self.use_hardware_accel,
+                'hw_accel_device': self.hw_accel_device,
+                'nvenc_cq': self.nvenc_cq,
+                'parallel_encodes': self.parallel_encodes,
+                'remux_threshold_gb': self.remux_threshold_gb,
+                'compression_nice': self.compression_nice,
+                'compression_reserved_cores': self.compression_reserved_cores,
+                'renditions': self.renditions,
+                'twitch_client_id': self.twitch_client_id,
+                'twitch_client_secret': self.twitch_client_secret,
+                'twitch_oauth_token': self.twitch_oauth_token,
+                'gql_live_check': self.gql_live_check
             }
+            data = json.dumps(self.config, indent=4)
+            if data == self._config_written:
+                return  # Nothing actually changed since the last write
             config_path = os.path.abspath(self.config_file)
             config_dir = os.path.dirname(config_path) or os.getcwd()
             if os.path.exists(config_path):
@@ -167,8 +432,27 @@ class StreamRecorder:
                         print(f"Config directory {config_dir} is not writable; skipping save")
                     return
 
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=4)
+            # Write to a temp file in the same directory and swap it in atomically.
+            # A config file bind-mounted into a container (or sitting in a
+            # read-only directory) can't be replaced, so write it in place there.
+            # Writers in other processes are serialised with a lock file.
+            dir_writable = os.access(config_dir, os.W_OK)
+            with exclusive_file_lock(config_path + '.lock' if dir_writable else config_path):
+                if dir_writable:
+                    with tempfile.NamedTemporaryFile('w', dir=config_dir, prefix='.config-', suffix='.tmp', delete=False) as f:
+                        f.write(data)
+                        f.flush()
+                        os.fsync(f.fileno())  # Contents must be on disk before the rename
+                    try:
+                        os.replace(f.name, config_path)
+                        self._config_written = data
+                        return
+                    except OSError:
+                        os.unlink(f.name)
+
+                with open(config_path, 'w') as f:
+                    f.write(data)
+                self._config_written = data
         except Exception as e:
             try:
                 self.logger.exception(f"Error saving config: {e}")
@@ -177,30 +461,231 @@ class StreamRecorder:
 
     def is_stream_live(self, channel_name):
         """Check if a Twitch channel is currently live."""
+        channels = [channel_name]
+        if self._batch_live_checks and channel_name in self._monitored_channels:
+            # Helix/GQL answers for every monitored channel in the same request, so
+            # the other monitor threads find their result already cached
+            channels = self._monitored_channels
+        return channel_name in self._check_live(channels)
+
+    def _check_live(self, channels):
+        """Return the subset of channels that are currently live"""
+        if self._batch_live_checks:
+            # One batched request at a time; callers arriving meanwhile are
+            # then served from the cache it fills
+            with self._helix_lock:
+                return self._check_live_cached(channels)
+        return self._check_live_cached(channels)
+
+    def _check_live_cached(self, channels):
+        """_check_live without the Helix request lock"""
+        now = time.monotonic()
+        results = {}
+        for channel in channels:
+            cached = self._live_cache.get(channel)
+            if cached and now - cached[0] < cached[2]:
+                results[channel] = cached[1]
+
+        pending = [channel for channel in channels if channel not in results]
+        if pending:
+            fresh = None
+            if self._helix_enabled:
+                live = self._check_live_helix(pending)
+                if live is not None:
+                    fresh = {channel: channel.lower() in live for channel in pending}
+            if fresh is None and self.gql_live_check:
+                live = self._check_live_gql(pending)
+                if live is not None:
+                    fresh = {channel: channel.lower() in live for channel in pending}
+            if fresh is None:
+                # Each check is a streamlink process waiting on the network, so
+                # run them side by side rather than one after another
+                with ThreadPoolExecutor(max_workers=min(16, len(pending))) as executor:
+                    fresh = dict(zip(pending, executor.map(self._is_stream_live_local, pending)))
+
+            checked_at = time.monotonic()
+            with self._live_cache_lock:
+                for channel, is_live in fresh.items():
+                    previous = self._live_cache.get(channel)
+                    ttl = LIVE_CACHE_STABLE_TTL if previous and previous[1] == is_live else LIVE_CACHE_TTL
+                    self._live_cache[channel] = (checked_at, is_live, ttl)
+            results.update(fresh)
+
+        return [channel for channel in channels if results[channel]]
+
+    def _helix_token(self):
+        """Return the configured token, or a cached app access token (fetched when expired)"""
+        if self.twitch_oauth_token:
+            return self.twitch_oauth_token
+
+        with self._app_token_lock:
+            if self._app_token and time.monotonic() < self._app_token_expires:
+                return self._app_token
+
+            response = self._http.post(TWITCH_TOKEN_URL, data={
+                'client_id': self._helix_client_id,
+                'client_secret': self._helix_client_secret,
+                'grant_type': 'client_credentials'
+            }, timeout=self.stream_check_timeout)
+            response.raise_for_status()
+            token = response.json()
+            self._app_token = token['access_token']
+            # Renew a minute early so a request never goes out with an expired token
+            self._app_token_expires = time.monotonic() + token.get('expires_in', 3600) - 60
+            return self._app_token
+
+    def _helix_get(self, params):
+        """GET /helix/streams over the pooled session"""
+        headers = {
+            'Client-Id': self._helix_client_id,
+            'Authorization': f'Bearer {self._helix_token()}'
+        }
+        return self._http.get(HELIX_STREAMS_URL, params=params, headers=headers, timeout=self.stream_check_timeout)
+
+    def _check_live_helix(self, channels):
+        """Look up channels with one Helix request per 100 logins; returns None on failure"""
+        live = set()
+        try:
+            for start in range(0, len(channels), HELIX_MAX_LOGINS):
+                params = [('user_login', channel) for channel in channels[start:start + HELIX_MAX_LOGINS]]
+                params.append(('first', str(HELIX_MAX_LOGINS)))
+                response = self._helix_get(params)
+                if response.status_code == 401 and not self.twitch_oauth_token:
+                    # App token revoked or expired early; fetch a new one and retry once
+                    self._app_token = None
+                    response = self._helix_get(params)
+                response.raise_for_status()
+                live.update(stream['user_login'].lower() for stream in response.json().get('data', []))
+            return live
+        except (requests.RequestException, ValueError, KeyError) as e:
+            self.logger.warning("Helix stream check failed, falling back to streamlink: %s", e)
+            return None
+
+    def _check_live_gql(self, channels):
+        """Look up channels with one GraphQL request per 100 logins; returns None on failure"""
+        live = set()
+        try:
+            for start in range(0, len(channels), HELIX_MAX_LOGINS):
+                chunk = channels[start:start + HELIX_MAX_LOGINS]
+                # One aliased user lookup per channel; names are already
+                # restricted to CHANNEL_NAME_RE so they are safe to inline
+                fields = ' '.join(f'u{i}: user(login: "{channel}") {{ stream {{ id }} }}' for i, channel in enumerate(chunk))
+                response = self._http.post(TWITCH_GQL_URL, json={'query': f'query {{ {fields} }}'},
+                                           headers={'Client-Id': TWITCH_WEB_CLIENT_ID},
+                                           timeout=self.stream_check_timeout)
+                response.raise_for_status()
+                data = response.json()['data']
+                live.update(channel.lower() for i, channel in enumerate(chunk)
+                            if (data.get(f'u{i}') or {}).get('stream'))
+            return live
+        except (requests.RequestException, ValueError, KeyError, TypeError, AttributeError) as e:
+            self.logger.warning("GQL stream check failed, falling back to streamlink: %s", e)
+            return None
+
+    def _is_stream_live_local(self, channel_name):
+        """Check a channel with streamlink, via the worker when it can answer"""
+        live = self._ask_streamlink_worker(channel_name)
+        return self._is_stream_live_streamlink(channel_name) if live is None else live
+
+    def _ask_streamlink_worker(self, channel_name):
+        """Send a check to the streamlink worker; returns None if it couldn't answer"""
+        with self._sl_worker_lock:
+            if self._sl_worker_crashes >= 3:
+                return None
+            waiter = self._sl_pending.get(channel_name)
+            if waiter is None:
+                try:
+                    if self._sl_worker is None:
+                        self._start_streamlink_worker()
+                    self._sl_worker.stdin.write(f"{channel_name}\n".encode())
+                    self._sl_worker.stdin.flush()
+                except OSError as e:
+                    self.logger.debug("streamlink worker unavailable for %s: %s", channel_name, e)
+                    return None
+                waiter = self._sl_pending[channel_name] = [threading.Event(), None]
+
+        # A Twitch check is several HTTP requests in a row (access token, then
+        # playlist), each allowed stream_check_timeout; leave room for all of them
+        if not waiter[0].wait(self.stream_check_timeout * 3):
+            with self._sl_worker_lock:
+                self._sl_pending.pop(channel_name, None)
+            return None
+        return waiter[1]
+
+    def _start_streamlink_worker(self):
+        """Launch the streamlink worker (caller holds _sl_worker_lock)"""
+        worker = subprocess.Popen(
+            [sys.executable, '-u', '-m', 'src.streamlink_worker', str(self.stream_check_timeout)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        )
+        threading.Thread(target=self._read_streamlink_worker, args=(worker,), daemon=True).start()
+        self._sl_worker = worker
+
+    def _read_streamlink_worker(self, worker):
+        """Hand the worker's answers to waiting checks; fail them all if it exits"""
+        for line in worker.stdout:
+            try:
+                reply = json_loads(line)
+            except ValueError:
+                continue
+            with self._sl_worker_lock:
+                waiter = self._sl_pending.pop(reply.get('channel'), None)
+            if waiter:
+                waiter[1] = reply.get('live')  # None on error -> per-process fallback
+                waiter[0].set()
+
+        worker.wait()
+        with self._sl_worker_lock:
+            if self._sl_worker is worker:
+                self._sl_worker = None
+                self._sl_worker_crashes += 1
+                self.logger.warning("streamlink worker exited (code %s)", worker.returncode)
+            pending, self._sl_pending = self._sl_pending, {}
+        for event, _ in pending.values():
+            event.set()
+
+    def _stop_streamlink_worker(self):
+        """Shut the streamlink worker down at exit"""
+        with self._sl_worker_lock:
+            worker, self._sl_worker = self._sl_worker, None
+        if worker:
+            worker.kill()
+            worker.wait()
+
+    def _is_stream_live_streamlink(self, channel_name):
+        """Check a single channel by probing it with streamlink --json"""
         timeout = float(getattr(self, 'stream_check_timeout', 10))
         retries = int(getattr(self, 'stream_check_retries', 2))
         backoff = float(getattr(self, 'stream_check_backoff', 5))
 
-        cmd = f"streamlink --json https://twitch.tv/{channel_name}"
+        cmd = [*self._streamlink_check_argv, f"https://twitch.tv/{channel_name}"]
 
         for attempt in range(1, retries + 2):
             try:
-                result = subprocess.run(
-                    cmd,
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=timeout
-                )
+                with self._probe_slots:
+                    result = subprocess.run(
+                        cmd,
+                        capture_output=True,
+                        timeout=timeout
+                    )
 
                 if result.returncode != 0:
                     # Non-zero exit code - log and possibly retry
-                    self.logger.debug("streamlink returned non-zero for %s (attempt %d): %s", channel_name, attempt, result.stderr.strip())
+                    self.logger.debug("streamlink returned non-zero for %s (attempt %d): %s", channel_name, attempt, result.stderr.decode(errors='replace').strip())
                     if self.run_headless and attempt == 1:
                         self.logger.warning("Error checking %s: connection issue or streamer offline", channel_name)
+                elif b'"streams"' not in result.stdout:
+                    # Offline/error output has no streams key; skip parsing it
+                    return False
+                elif STREAMS_FOUND_RE.search(result.stdout):
+                    # At least one stream listed; no need to parse the whole document
+                    return True
                 else:
                     try:
-                        stream_info = json.loads(result.stdout)
+                        stream_info = json_loads(result.stdout)
                         return stream_info.get('streams') is not None and len(stream_info.get('streams')) > 0
                     except json.JSONDecodeError:
                         self.logger.debug("Failed to parse streamlink JSON for %s (attempt %d)", channel_name, attempt)
@@ -213,11 +698,16 @@ class StreamRecorder:
                 self.logger.warning("Unexpected error when checking %s (attempt %d): %s", channel_name, attempt, str(e))
 
             if attempt <= retries:
-                sleep_time = backoff * (2 ** (attempt - 1))
+                sleep_time = backoff * (2 ** (attempt - 1)) * random.uniform(0.8, 1.2)
                 self.logger.debug("Retrying %s in %.1f seconds (attempt %d of %d)", channel_name, sleep_time, attempt + 1, retries + 1)
                 if self.run_headless:
                     self.logger.info("Retrying %s in %.0f seconds...", channel_name, sleep_time)
-                time.sleep(sleep_time)
+                if self._monitored_channels:
+                    # While monitoring, stopping interrupts the backoff immediately
+                    if self.stop_all_recordings.wait(sleep_time):
+                        break
+                else:
+                    time.sleep(sleep_time)
 
         # All attempts exhausted
         self.logger.debug("All attempts exhausted checking if %s is live; marking as offline", channel_name)
@@ -225,126 +715,258 @@ class StreamRecorder:
             self.logger.warning("Internet disconnection detected - monitoring paused, will retry in next check interval")
         return False
 
+    def streamlink_progress_flag(self):
+        """Return the streamlink option that forces progress output when stderr is a pipe"""
+        if self._streamlink_progress_flag is None:
+            try:
+                result = subprocess.run([self._streamlink_bin, '--version'], capture_output=True, timeout=10)
+                version = tuple(int(part) for part in re.search(rb'(\d+)\.(\d+)', result.stdout).groups())
+            except Exception:
+                version = (0, 0)
+            # --force-progress was replaced by --progress=force in streamlink 6.2
+            self._streamlink_progress_flag = '--progress=force' if version >= (6, 2) else '--force-progress'
+        return self._streamlink_progress_flag
+
+    def ensure_directory(self, path):
+        """Create a directory once per session; later calls are a set lookup"""
+        if path not in self._dirs_created:
+            os.makedirs(path, exist_ok=True)
+            self._dirs_created.add(path)
+
     def find_live_streamers(self):
         """Find which streamers in the list are currently live"""
-        live_streamers = []
-        print("Checking live status of streamers...")
-        for streamer in self.streamers:
-            if self.is_stream_live(streamer):
-                live_streamers.append(streamer)
-        return live_streamers
+        if self.verbose:
+            print("Checking live status of streamers...")
+        return self._check_live(self.streamers)
 
     def record_stream(self, channel_name):
         """Record a single stream"""
         try:
-            os.makedirs(self.output_directory, exist_ok=True)
-
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_file = os.path.join(self.output_directory, f"{channel_name}_{timestamp}.ts")
-            
+            self.wait_and_stop(self.start_recording(channel_name))
+        except Exception as e:
             try:
-                self.logger.info(f"Recording {channel_name}'s stream to {output_file}")
+                self.logger.exception(f"Error recording {channel_name}'s stream: {e}")
             except Exception:
-                print(f"[{datetime.now()}] Recording {channel_name}'s stream to {output_file}")
-            
-            command = f"streamlink https://twitch.tv/{channel_name} best -o {output_file}"
-            self.current_process = subprocess.Popen(command, shell=True)
-            
-            def monitor_process():
-                self.current_process.wait()
+                print(f"Error recording {channel_name}'s stream: {e}")
+
+    def start_recording(self, channel_name):
+        """Start streamlink recording a channel and return the process"""
+        self.ensure_directory(self.output_directory)
+
+        timestamp = recording_timestamp()
+        output_file = os.path.join(self.output_directory, f"{channel_name}_{timestamp}.ts")
+        
+        try:
+            self.logger.info(f"Recording {channel_name}'s stream to {output_file}")
+        except Exception:
+            print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] Recording {channel_name}'s stream to {output_file}")
+        
+        command = [self._streamlink_bin, f"https://twitch.tv/{channel_name}", "best", "-o", output_file]
+        process = self.current_process = subprocess.Popen(command)
+        return process
+
+    def wait_and_stop(self, process):
+        """Wait for a recording to end, or for Enter/Ctrl+C/SIGTERM, then stop it"""
+        # The signal handlers only exist while a recording is active
+        stop = threading.Event()
+        previous_handlers = {
+            sig: signal.signal(sig, lambda signum, frame: stop.set())
+            for sig in (signal.SIGINT, signal.SIGTERM)
+        }
+        try:
+            print("Press Enter or Ctrl+C to stop recording manually...")
+            if not self.wait_for_exit_or_enter(process, stop):
                 try:
                     self.logger.info("Stream ended naturally.")
                 except Exception:
                     print("Stream ended naturally.")
-                self.stop_recording()
-                
-            monitor_thread = threading.Thread(target=monitor_process)
-            monitor_thread.daemon = True
-            monitor_thread.start()
-            
-            print("Press Enter to stop recording manually...")
-            input()  # This still allows manual stopping
-            if self.current_process and self.current_process.poll() is None:
-                self.stop_recording()
-        except Exception as e:
+        finally:
+            for sig, handler in previous_handlers.items():
+                signal.signal(sig, handler)
+        self.stop_recording()
+
+    def wait_for_exit_or_enter(self, process, stop):
+        """Block until the process exits, Enter is pressed or stop is set; returns True if stopped manually"""
+        if not sys.stdin.isatty():
+            # No keyboard to read (e.g. piped stdin); only a signal can stop the recording
+            while process.poll() is None:
+                if stop.wait(0.5):
+                    return True
+            return False
+
+        with selectors.DefaultSelector() as selector:
             try:
-                self.logger.exception(f"Error recording {channel_name}'s stream: {e}")
-            except Exception:
-                print(f"Error recording {channel_name}'s stream: {e}")
+                selector.register(sys.stdin, selectors.EVENT_READ)
+            except (ValueError, OSError):
+                # stdin can't be polled (e.g. Windows console); fall back to reading it on a thread
+                reader = threading.Thread(target=lambda: (input(), stop.set()))
+                reader.daemon = True
+                reader.start()
+                while process.poll() is None:
+                    if stop.wait(0.5):
+                        return True
+                return False
+
+            while process.poll() is None and not stop.is_set():
+                if selector.select(timeout=0.5):
+                    sys.stdin.readline()
+                    return True
+        return stop.is_set()
 
     def record_stream_concurrent(self, channel_name, progress=None, task_id=None):
-        """Record a single stream with progress tracking"""
+        """Record a single stream with progress tracking; returns True if any data was written"""
+        process = None
+        output_file = None
+        recorded = False
         try:
-            os.makedirs(self.output_directory, exist_ok=True)
+            self.ensure_directory(self.output_directory)
 
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = recording_timestamp()
             output_file = os.path.join(self.output_directory, f"{channel_name}_{timestamp}.ts")
 
             if self.run_headless:
                 self.logger.info("%s is live - starting recording to %s", channel_name, os.path.basename(output_file))
             elif progress and task_id is not None:
-                progress.update(task_id, description=f"[green]{channel_name}: Recording...")
-
-            command = f"streamlink https://twitch.tv/{channel_name} best -o {output_file}"
+                self.set_progress(channel_name, description=f"[green]{channel_name}: Recording...")
+
+            command = [
+                self._streamlink_bin, f"https://twitch.tv/{channel_name}", "best", "-o", output_file,
+                self.streamlink_progress_flag()
+            ]
+            # stdout is never read; stderr is drained by the progress reader below
+            # Own session so a force-kill takes streamlink's children down with it
             process = subprocess.Popen(
                 command,
-                shell=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                start_new_session=True
             )
 
             self.active_recordings[channel_name] = process
 
-            while process.poll() is None and not self.stop_all_recordings.is_set():
-                if os.path.exists(output_file):
-                    file_size = os.path.getsize(output_file)
-                    if progress and task_id is not None:
-                        progress.update(task_id, completed=file_size / (1024 * 1024))  # Convert to MB
-                time.sleep(1)
+            # Set when streamlink exits or when monitoring is interrupted
+            done = threading.Event()
+            self._recording_wakeups[channel_name] = done
+            if self.stop_all_recordings.is_set():
+                done.set()
+
+            # streamlink reports the bytes written on stderr; read that instead of stat()ing the file.
+            # stderr hits EOF when streamlink exits, so the same thread also reaps it.
+            written = [0]
+
+            def watch_process():
+                try:
+                    drain_streamlink_progress(process.stderr, written)
+                    process.wait()
+                finally:
+                    # Never leave the recording thread blocked in done.wait()
+                    done.set()
+
+            reader = threading.Thread(target=watch_process)
+            reader.daemon = True
+            reader.start()
+
+            def recorded_bytes():
+                if written[0]:
+                    return written[0]
+                # No progress reported (yet); fall back to a single stat of the output file
+                try:
+                    return os.stat(output_file).st_size
+                except FileNotFoundError:
+                    return 0
+
+            # The progress updater thread samples the size once per tick
+            self._progress_sizes[channel_name] = recorded_bytes
+            done.wait()
+            recorded = recorded_bytes() > 0
 
             # Process ended or stop requested
             if self.stop_all_recordings.is_set() and process.poll() is None:
                 if self.run_headless:
                     self.logger.info("%s: Stopping recording gracefully...", channel_name)
                 elif progress and task_id is not None:
-                    progress.update(task_id, description=f"[yellow]{channel_name}: Stopping gracefully...")
+                    self.set_progress(channel_name, description=f"[yellow]{channel_name}: Stopping gracefully...")
                 process.terminate()
                 try:
-                    process.wait(timeout=5)
+                    wait_for_process(process, 5)
                     if self.run_headless:
                         self.logger.info("%s: Recording stopped and saved", channel_name)
                     elif progress and task_id is not None:
-                        progress.update(task_id, description=f"[blue]{channel_name}: Stopped and saved")
+                        self.set_progress(channel_name, description=f"[blue]{channel_name}: Stopped and saved")
                 except subprocess.TimeoutExpired:
-                    process.kill()
+                    kill_process_group(process)
                     if self.run_headless:
                         self.logger.warning("%s: Recording force stopped", channel_name)
                     elif progress and task_id is not None:
-                        progress.update(task_id, description=f"[red]{channel_name}: Force stopped")
+                        self.set_progress(channel_name, description=f"[red]{channel_name}: Force stopped")
             else:
                 if self.run_headless:
                     self.logger.info("%s: Stream ended, saved to %s", channel_name, os.path.basename(output_file))
                 elif progress and task_id is not None:
-                    progress.update(task_id, description=f"[blue]{channel_name}: Stream ended, saved to {os.path.basename(output_file)}")
+                    self.set_progress(channel_name, description=f"[blue]{channel_name}: Stream ended, saved to {os.path.basename(output_file)}")
 
         except Exception as e:
             if self.run_headless:
                 self.logger.error("%s: Recording error - %s", channel_name, str(e))
             elif progress and task_id is not None:
-                progress.update(task_id, description=f"[red]{channel_name}: Error - {str(e)}")
+                self.set_progress(channel_name, description=f"[red]{channel_name}: Error - {str(e)}")
         finally:
+            # Always reap streamlink so no <defunct> entry is left behind
+            if process is not None:
+                try:
+                    wait_for_process(process, 1)
+                except subprocess.TimeoutExpired:
+                    kill_process_group(process)
+                    process.wait()
+            if output_file and not os.path.exists(output_file):
+                # Nothing was written, possibly because the directory was removed
+                # while we were running; create it again before the next recording
+                self._dirs_created.discard(self.output_directory)
             if channel_name in self.active_recordings:
                 del self.active_recordings[channel_name]
+            self._recording_wakeups.pop(channel_name, None)
+            self._progress_sizes.pop(channel_name, None)
+            # The cached "live" result predates the end of the stream; make the
+            # next check ask Twitch again
+            with self._live_cache_lock:
+                self._live_cache.pop(channel_name, None)
+        return recorded
+
+    def set_progress(self, channel_name, **fields):
+        """Queue a progress-bar change for a channel; applied on the updater's next tick"""
+        with self._progress_lock:
+            self._progress_state.setdefault(channel_name, {}).update(fields)
+
+    def apply_progress(self, progress, tasks):
+        """Push queued descriptions and current recording sizes to the progress bar"""
+        with self._progress_lock:
+            pending, self._progress_state = self._progress_state, {}
+        for channel_name, task_id in tasks.items():
+            fields = pending.get(channel_name, {})
+            size_source = self._progress_sizes.get(channel_name)
+            if size_source:
+                fields['completed'] = size_source() / (1024 * 1024)  # Convert to MB
+            if fields:
+                progress.update(task_id, **fields)
 
     def monitor_and_record_streamer(self, channel_name, check_interval, progress=None, task_id=None):
         """Continuously monitor and record a streamer when they go live"""
+        # Status lines only depend on the channel and interval; build them once
+        desc_checking = f"[cyan]{channel_name}: Checking if live..."
+        desc_detected = f"[yellow]{channel_name}: Stream detected! Starting recording..."
+        desc_waiting = f"[cyan]{channel_name}: Waiting 30s before next check..."
+        desc_offline = f"[dim]{channel_name}: Offline - checking in {check_interval}m..."
+        desc_stopped = f"[blue]{channel_name}: Monitoring stopped"
+
         if self.run_headless:
             self.logger.info("%s: Starting monitoring", channel_name)
         elif progress and task_id is not None:
-            progress.update(task_id, description=f"[cyan]{channel_name}: Checking if live...")
+            self.set_progress(channel_name, description=desc_checking)
         
         connection_errors = 0
         max_connection_errors = 3
+        max_interval = max(check_interval, self.max_check_interval)
+        wait_minutes = check_interval
 
         while not self.stop_all_recordings.is_set():
             try:
@@ -360,50 +982,60 @@ class StreamRecorder:
                     if self.run_headless:
                         self.logger.info("%s: Stream detected! Starting recording...", channel_name)
                     elif progress and task_id is not None:
-                        progress.update(task_id, description=f"[yellow]{channel_name}: Stream detected! Starting recording...")
-
-                    self.record_stream_concurrent(channel_name, progress, task_id)
-
-                    if not self.stop_all_recordings.is_set():
-                        if self.run_headless:
-                            self.logger.info("%s: Waiting 30 seconds before next check...", channel_name)
-                        elif progress and task_id is not None:
-                            progress.update(task_id, description=f"[cyan]{channel_name}: Waiting 30s before next check...")
-                        for _ in range(30):
-                            if self.stop_all_recordings.is_set():
+                        self.set_progress(channel_name, description=desc_detected)
+
+                    recorded = self.record_stream_concurrent(channel_name, progress, task_id)
+                    if wait_minutes != check_interval:
+                        wait_minutes = check_interval
+                        desc_offline = f"[dim]{channel_name}: Offline - checking in {check_interval}m..."
+
+                    if recorded:
+                        if not self.stop_all_recordings.is_set():
+                            if self.run_headless:
+                                self.logger.info("%s: Waiting 30 seconds before next check...", channel_name)
+                            elif progress and task_id is not None:
+                                self.set_progress(channel_name, description=desc_waiting)
+                            if self.stop_all_recordings.wait(30):
                                 break
-                            time.sleep(1)
+                        # Re-check right away: a stream that dropped is often back
+                        # within seconds and shouldn't wait a full check interval
+                        continue
+                    # streamlink wrote nothing (sub-only, ad gate, stale "live" result...);
+                    # wait the normal interval instead of retrying every 30s
                 else:
                     # Not live, show monitoring status
                     if progress and task_id is not None:
-                        progress.update(task_id, description=f"[dim]{channel_name}: Offline - checking in {check_interval}m...")
+                        self.set_progress(channel_name, description=desc_offline)
 
-                if not self.stop_all_recordings.is_set():
-                    wait_time = check_interval * 60
-                    for _ in range(wait_time):
-                        if self.stop_all_recordings.is_set():
-                            break
-                        time.sleep(1)
+                # Returns immediately once stop is requested
+                self.stop_all_recordings.wait(wait_minutes * 60)
+                if wait_minutes < max_interval:
+                    wait_minutes = min(max_interval, wait_minutes * 1.5)
+                    desc_offline = f"[dim]{channel_name}: Offline - checking in {wait_minutes:.3g}m..."
 
             except Exception as e:
                 connection_errors += 1
+                # Back off exponentially (1m, 2m, 4m ... 30m) with jitter so
+                # monitors don't all retry in lockstep during an outage
+                retry_in = min(1800, 60 * 2 ** (connection_errors - 1)) * random.uniform(0.8, 1.2)
                 if self.run_headless:
                     self.logger.error("%s: Error during monitoring - %s", channel_name, str(e))
                     if connection_errors >= max_connection_errors:
-                        self.logger.warning("%s: Multiple connection failures detected - monitoring paused, retrying in %d seconds", channel_name, 60)
+                        self.logger.warning("%s: Multiple connection failures detected - monitoring paused, retrying in %d seconds", channel_name, retry_in)
                 elif progress and task_id is not None:
-                    progress.update(task_id, description=f"[red]{channel_name}: Error - {str(e)}")
-                time.sleep(60)  # Wait a minute before retrying on error
+                    self.set_progress(channel_name, description=f"[red]{channel_name}: Error - {str(e)}")
+                self.stop_all_recordings.wait(retry_in)
 
         if self.run_headless:
             self.logger.info("%s: Monitoring stopped", channel_name)
         elif progress and task_id is not None:
-            progress.update(task_id, description=f"[blue]{channel_name}: Monitoring stopped")
+            self.set_progress(channel_name, description=desc_stopped)
 
     def monitor_multiple_streamers(self, selected_streamers, check_interval):
         """Monitor and record multiple streamers concurrently with progress bars"""
         self.stop_all_recordings.clear()
         self.monitoring_interrupted = False
+        self._monitored_channels = tuple(selected_streamers)
 
         original_sigint_handler = signal.signal(signal.SIGINT, self.monitoring_signal_handler)
 
@@ -422,7 +1054,6 @@ class StreamRecorder:
                     thread.daemon = True
                     thread.start()
                     threads.append(thread)
-                    self.recording_threads[streamer] = thread
 
                 for thread in threads:
                     thread.join()
@@ -431,8 +1062,6 @@ class StreamRecorder:
                     self.logger.info("All monitoring stopped")
                 else:
                     self.logger.info("All monitoring completed")
-                
-                self.recording_threads.clear()
             else:
                 # Interactive mode: Rich progress bars
                 with Progress(
@@ -457,7 +1086,18 @@ class StreamRecorder:
                         thread.daemon = True
                         thread.start()
                         threads.append(thread)
-                        self.recording_threads[streamer] = thread
+
+                    # One thread redraws every task once per second instead of each
+                    # monitor thread updating the bar on its own
+                    updater_done = threading.Event()
+
+                    def refresh_progress():
+                        while not updater_done.wait(1.0):
+                            self.apply_progress(progress, tasks)
+
+                    updater = threading.Thread(target=refresh_progress)
+                    updater.daemon = True
+                    updater.start()
 
                     # Show instructions
                     self.console.print("\n[bold yellow]Press Ctrl+C to stop all monitoring and save any active recordings[/bold yellow]")
@@ -465,22 +1105,25 @@ class StreamRecorder:
                     for thread in threads:
                         thread.join()
 
+                    updater_done.set()
+                    updater.join()
+                    self.apply_progress(progress, tasks)
+
                     if self.monitoring_interrupted:
                         self.console.print("\n[bold green]All monitoring stopped. Returning to menu...[/bold green]")
                     else:
                         self.console.print("\n[bold green]All monitoring completed[/bold green]")
-                    
-                    self.recording_threads.clear()
 
         finally:
             signal.signal(signal.SIGINT, original_sigint_handler)
+            self._monitored_channels = ()
 
     def stop_recording(self):
         """Stop the current recording"""
         if self.current_process:
             try:
                 self.current_process.terminate()
-                self.current_process.wait(timeout=5)
+                wait_for_process(self.current_process, 5)
                 print("Recording stopped.")
 
                 if hasattr(self, 'monitor_after_stream') and self.monitor_after_stream:
@@ -509,7 +1152,7 @@ class StreamRecorder:
         if streamer == 'q':
             return
 
-        if streamer and streamer not in self.streamers:
+        if CHANNEL_NAME_RE.match(streamer) and streamer not in self.streamers:
             self.streamers.append(streamer)
             self.save_config()
             print(f"Added {streamer} to monitored streamers.")
@@ -550,7 +1193,8 @@ class StreamRecorder:
     def periodic_live_check(self, check_interval):
         """Periodically check for live streamers"""
         while not self.stop_monitoring_event.is_set():
-            print(f"\nChecking for live streamers (interval: {check_interval} minutes)...")
+            if self.verbose:
+                print(f"\nChecking for live streamers (interval: {check_interval} minutes)...")
             live_streamers = self.find_live_streamers()
 
             if live_streamers:
@@ -639,9 +1283,10 @@ class StreamRecorder:
             print(f"4. Change Default Compression CRF (Current: {self.default_crf})")
             print(f"5. Change Default Compression Preset (Current: {self.default_preset})")
             print(f"6. Toggle Headless Mode (Current: {'Enabled' if self.run_headless else 'Disabled'})")
+            print(f"7. Change Parallel Encodes (Current: {self.parallel_encodes or 'Auto'})")
             print("q. Back to Main Menu")
 
-            choice = input("Enter your choice (1-6, q): ").strip().lower()
+            choice = input("Enter your choice (1-7, q): ").strip().lower()
 
             if choice == '1':
                 new_dir = input(f"\nEnter new output directory (current: {self.output_directory}): ").strip()
@@ -711,17 +1356,52 @@ class StreamRecorder:
                     print("Note: In headless mode, the application will run without interactive menus.")
                     print("This is useful for Docker containers or automated deployments.")
                 input("Press Enter to continue...")
+            elif choice == '7':
+                try:
+                    print("\nNumber of files to compress at the same time (0 = auto)")
+                    print("Auto runs one libx265 encode per half of the CPU cores, and one hardware encode at a time")
+                    new_parallel = input(f"Enter parallel encodes (current: {self.parallel_encodes or 'Auto'}): ").strip()
+                    if new_parallel:
+                        parallel = int(new_parallel)
+                        if parallel >= 0:
+                            self.parallel_encodes = parallel
+                            self.save_config()
+                            print(f"Parallel encodes changed to: {self.parallel_encodes or 'Auto'}")
+                        else:
+                            print("Parallel encodes must be 0 or greater.")
+                    input("Press Enter to continue...")
+                except ValueError:
+                    print("Invalid input. Please enter a valid number.")
+                    input("Press Enter to continue...")
             elif choice == 'q':
                 break
             else:
                 print("Invalid choice. Please try again.")
                 input("Press Enter to continue...")
 
+    def _detect_hw_encoder(self):
+        """Return the HEVC encoder to compress with (hardware detection is cached)"""
+        if self.use_hardware_accel:
+            return compress_module.detect_hw_encoder(self.hw_accel_device) or 'libx265'
+        return 'libx265'
+
+    def _encode_workers(self, encoder):
+        """Return (parallel encodes, libx265 threads per encode or None) for a batch"""
+        cpu_count = max(1, (os.cpu_count() or 1) - self.compression_reserved_cores)
+        if self.parallel_encodes > 0:
+            workers = self.parallel_encodes
+        elif encoder == 'libx265':
+            # x265 stops scaling well past a handful of threads, so split the cores
+            workers = min(2, cpu_count)
+        else:
+            # Hardware encoders have a limited number of sessions
+            workers = 1
+        if workers > 1 and encoder == 'libx265':
+            return workers, max(1, cpu_count // workers)
+        return workers, None
+
     def compress_recordings(self, dry_run=False):
         """Compress .ts recordings to .mp4 format with H.265"""
-        from pathlib import Path
-        import src.compression as compress_module
-        
         # Reset the interrupted flag before starting
         compress_module.interrupted = False
         
@@ -731,7 +1411,15 @@ class StreamRecorder:
             input("Press Enter to continue...")
             return
         
-        ts_files = sorted([f for f in output_path.glob("*.ts") if not f.name.startswith('._')])
+        # scandir gets the file type from the listing itself; sizes are read once
+        # here and carried along instead of re-stat'ing every file later on
+        with os.scandir(output_path) as it:
+            ts_files = sorted(
+                ((Path(entry.path), entry.stat().st_size)
+                 for entry in it
+                 if entry.name.endswith('.ts') and not entry.name.startswith('._') and entry.is_file()),
+                key=lambda item: item[0].name
+            )
         
         if not ts_files:
             print(f"No .ts files found in {self.output_directory}")
@@ -739,9 +1427,11 @@ class StreamRecorder:
             return
         
         print(f"\nFound {len(ts_files)} .ts file(s) to compress:\n")
-        for i, ts_file in enumerate(ts_files, 1):
-            file_size = ts_file.stat().st_size / (1024 * 1024 * 1024)  # GB
-            print(f"{i}. {ts_file.name} ({file_size:.2f} GB)")
+        # One write for the whole listing rather than a print per file
+        print("\n".join(
+            f"{i}. {ts_file.name} ({ts_file_size / (1024 * 1024 * 1024):.2f} GB)"
+            for i, (ts_file, ts_file_size) in enumerate(ts_files, 1)
+        ))
         
         print("\nCompress Options:")
         print("1. Compress all files")
@@ -779,13 +1469,34 @@ class StreamRecorder:
         
         compressed_path = Path(self.compressed_directory)
         try:
-            compressed_path.mkdir(parents=True, exist_ok=True)
+            self.ensure_directory(self.compressed_directory)
         except Exception as e:
             print(f"Error creating compressed directory: {e}")
             input("Press Enter to continue...")
             return
         
+        # Work out every output path up front: (source, size, output, renditions, remux only)
+        remux_below = self.remux_threshold_gb * 1024 ** 3
+        plan = [
+            (
+                ts_file,
+                ts_file_size,
+                compressed_path / (ts_file.stem + '.mp4'),
+                [
+                    (compressed_path / (ts_file.stem + r['suffix'] + '.mp4'), int(r.get('crf', crf)), r.get('height'))
+                    for r in self.renditions
+                ],
+                ts_file_size < remux_below
+            )
+            for ts_file, ts_file_size in selected_files
+        ]
+        # Quick remux-only files go first so the batch shows progress early
+        plan.sort(key=lambda entry: not entry[4])
+        
+        encoder = self._detect_hw_encoder()
+        
         print(f"\nWill compress {len(selected_files)} file(s) to: {self.compressed_directory}")
+        print(f"Encoder: {encoder}{'' if encoder == 'libx265' else ' (hardware)'}")
         print(f"Quality settings: CRF={crf}, preset={preset} (change in Settings menu if needed)")
         
         auto_delete = False
@@ -811,84 +1522,102 @@ class StreamRecorder:
         stats = compress_module.CompressStats()
         stats.total_found = len(selected_files)
         
+        total_bytes = sum(ts_file_size for _, ts_file_size in selected_files)
+        
         try:
-            for ts_file in selected_files:
-                if compress_module.interrupted:
-                    print("\n[WARNING] Processing interrupted by user")
-                    break
-                
-                output_file = compressed_path / ts_file.with_suffix('.mp4').name
-                
-                if compress_module.mp4_exists_and_valid(output_file):
-                    print(f"[INFO] Skipping {ts_file.name} - valid MP4 already exists")
-                    stats.skipped_existing += 1
-                    
-                    # since compression was already done previously
-                    if auto_yes:
-                        try:
-                            ts_file.unlink()
-                            print(f"[INFO] Deleted original: {ts_file.name}")
-                            stats.deleted += 1
-                        except Exception as e:
-                            print(f"[WARNING] Failed to delete {ts_file.name}: {e}")
-                    else:
-                        print(f"[INFO] Kept original: {ts_file.name}")
-                    
-                    continue
+            with Progress(
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                DownloadColumn(),
+                TransferSpeedColumn(),
+                TimeRemainingColumn(),
+                console=self.console,
+                disable=dry_run
+            ) as progress:
+                task_id = progress.add_task("Compressing", total=total_bytes)
+                log = progress.console.print
                 
                 if dry_run:
-                    # Dry run mode - just show what would be done
-                    print(f"[DRY RUN] Would compress: {ts_file.name}")
-                    print(f"[DRY RUN]   Input:  {ts_file}")
-                    print(f"[DRY RUN]   Output: {output_file}")
-                    print(f"[DRY RUN]   Settings: CRF={crf}, preset={preset}")
-                    input_size = ts_file.stat().st_size / (1024 * 1024 * 1024)
-                    print(f"[DRY RUN]   Input size: {input_size:.2f} GB")
-                    if auto_yes:
-                        print(f"[DRY RUN]   Would delete original after compression")
-                    print()
-                    stats.processed += 1
-                    stats.succeeded += 1
-                    continue
-                
-                print(f"[PROGRESS] Processing: {ts_file.name}")
-                print(f"[INFO] Compressing {ts_file.name} -> {output_file.name}")
-                print(f"[INFO] Using CRF={crf}, preset={preset}")
-                
-                if not compress_module.compress_file(ts_file, output_file, allow_video_only=False, crf=crf, preset=preset):
-                    if compress_module.interrupted:
-                        print("\n[WARNING] Compression interrupted")
-                        break
-                    print(f"[ERROR] Compression failed for {ts_file.name}")
-                    stats.failed += 1
-                    stats.errors.append((ts_file.name, "Compression failed"))
-                    continue
-                
-                print(f"[INFO] Verifying {output_file.name}")
-                success, message = compress_module.verify_compression(ts_file, output_file)
-                
-                if not success:
-                    print(f"[ERROR] Verification failed for {output_file.name}: {message}")
-                    stats.failed += 1
-                    stats.errors.append((ts_file.name, message))
-                    continue
-                
-                print(f"[SUCCESS] Successfully compressed and verified: {output_file.name}")
-                stats.succeeded += 1
-                stats.processed += 1
-                
-                # Handle deletion
-                if auto_yes:
-                    try:
-                        ts_file.unlink()
-                        print(f"[INFO] Deleted original: {ts_file.name}")
-                        stats.deleted += 1
-                    except Exception as e:
-                        print(f"[WARNING] Failed to delete {ts_file.name}: {e}")
+                    for ts_file, ts_file_size, output_file, _, remux_only in plan:
+                        
+                        if compress_module.mp4_exists_and_valid(output_file):
+                            log(f"[INFO] Skipping {ts_file.name} - valid MP4 already exists")
+                            stats.skipped_existing += 1
+                            continue
+                        
+                        # Dry run mode - just show what would be done, one write per file
+                        lines = [
+                            f"[DRY RUN] Would {'remux' if remux_only else 'compress'}: {ts_file.name}",
+                            f"[DRY RUN]   Input:  {ts_file}",
+                            f"[DRY RUN]   Output: {output_file}",
+                            f"[DRY RUN]   Settings: CRF={crf}, preset={preset}",
+                            f"[DRY RUN]   Input size: {ts_file_size / (1024 * 1024 * 1024):.2f} GB"
+                        ]
+                        if auto_yes:
+                            lines.append("[DRY RUN]   Would delete original after compression")
+                        log("\n".join(lines) + "\n")
+                        stats.processed += 1
+                        stats.succeeded += 1
                 else:
-                    print(f"[INFO] Kept original: {ts_file.name}")
-                
-                print()  # Blank line between files
+                    workers, threads = self._encode_workers(encoder)
+                    if workers > 1:
+                        progress.update(task_id, description=f"Compressing ({workers} at a time)")
+                    
+                    # spawn rather than fork: the recorder has logging/config threads running
+                    executor = ProcessPoolExecutor(
+                        max_workers=workers,
+                        mp_context=multiprocessing.get_context('spawn'),
+                        initializer=compress_module.init_worker,
+                        initargs=(self.compression_nice, self.compression_reserved_cores)
+                    )
+                    try:
+                        futures = {}
+                        for ts_file, ts_file_size, output_file, renditions, remux_only in plan:
+                            future = executor.submit(
+                                compress_module.compress_recording, ts_file, output_file, crf, preset, auto_yes,
+                                encoder, self.hw_accel_device, self.nvenc_cq, threads, renditions, remux_only
+                            )
+                            futures[future] = (ts_file, output_file, ts_file_size)
+                        
+                        for future in as_completed(futures):
+                            ts_file, output_file, ts_file_size = futures[future]
+                            try:
+                                result = future.result()
+                            except Exception as e:
+                                result = compress_module.CompressResult(ts_file.name)
+                                result.message = str(e)
+                            
+                            progress.update(task_id, advance=ts_file_size)
+                            
+                            if result.status == "interrupted":
+                                compress_module.interrupted = True
+                                log("\n[WARNING] Compression interrupted")
+                                break
+                            if result.status == "skipped":
+                                # since compression was already done previously
+                                log(f"[INFO] Skipping {ts_file.name} - valid MP4 already exists")
+                                stats.skipped_existing += 1
+                            elif result.status == "succeeded":
+                                stats.succeeded += 1
+                                stats.processed += 1
+                                if self.verbose:
+                                    progress.console.log(f"ok {ts_file.name} -> {output_file.name}")
+                            else:
+                                log(f"[ERROR] {ts_file.name}: {result.message}")
+                                stats.failed += 1
+                                stats.errors.append((ts_file.name, result.message))
+                            
+                            if result.deleted:
+                                stats.deleted += 1
+                                log(f"[INFO] Deleted original: {ts_file.name}")
+                            elif result.delete_error:
+                                log(f"[WARNING] Failed to delete {ts_file.name}: {result.delete_error}")
+                    except KeyboardInterrupt:
+                        compress_module.interrupted = True
+                        raise
+                    finally:
+                        # Drop queued files; running encodes see the same Ctrl+C and clean up
+                        executor.shutdown(wait=True, cancel_futures=True)
         
         except KeyboardInterrupt:
             print("\n[WARNING] Operation cancelled by user")